@@ -1,6 +1,7 @@
 import functools
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
 from datetime import datetime
 
@@ -9,6 +10,8 @@ from ytmusicapi import YTMusic, setup_oauth
 
 version = "1.0"
 config_filename = "config.json"
+# Number of concurrent searches when resolving unavailable playlist tracks
+resolve_workers = 8
 
 
 def prompt_yes_no(message: str, default_yes: bool = True) -> bool:
@@ -160,6 +163,54 @@ def copy_likes(ytm: Tuple[YTMusic, YTMusic]):
         print(f"Failed to copy likes: {str(e)}")
 
 
+def is_track_unavailable(track: dict) -> bool:
+    """Check whether a playlist track can't be added to a playlist as-is."""
+    return not track.get("videoId") or track.get("isAvailable") is False
+
+
+def resolve_unavailable_tracks(ytm: YTMusic, tracks: list[dict]) -> list[str]:
+    """
+    Build the list of videoIds for a playlist copy, replacing unavailable
+    tracks with playable equivalents found through find_best_match.
+    Tracks without a match are dropped. Playlist order is preserved.
+    """
+    unavailable = [i for i, track in enumerate(tracks) if is_track_unavailable(track)]
+    song_ids = [track.get("videoId") for track in tracks]
+    if not unavailable:
+        return song_ids
+
+    print(f"Resolving {len(unavailable)} unavailable tracks...")
+
+    def resolve(track: dict) -> str | None:
+        title = track.get("title") or ""
+        artists = [artist.get("name", "") for artist in track.get("artists") or []]
+        duration = (track.get("duration_seconds") or 0) * 1000  # Convert to ms
+        if not title:
+            return None
+        return find_best_match(ytm, title, artists, duration)
+
+    with ThreadPoolExecutor(max_workers=resolve_workers) as executor:
+        matches = list(executor.map(resolve, [tracks[i] for i in unavailable]))
+
+    resolved = 0
+    for i, match_id in zip(unavailable, matches):
+        track = tracks[i]
+        title = track.get("title") or track.get("videoId") or "Unknown track"
+        artists = ", ".join(
+            artist.get("name", "") for artist in track.get("artists") or []
+        )
+        label = f"{title} by {artists}" if artists else title
+        if match_id:
+            print(f"✓ Substituted: {label} -> {match_id}")
+            resolved += 1
+        else:
+            print(f"✗ No playable match, skipping: {label}")
+        song_ids[i] = match_id
+
+    print(f"Resolved {resolved} out of {len(unavailable)} unavailable tracks")
+    return [song_id for song_id in song_ids if song_id]
+
+
 def copy_playlist(
     ytm: Tuple[YTMusic, YTMusic], playlist_id: str, playlist_name: str = ""
 ):
@@ -169,9 +220,7 @@ def copy_playlist(
         print("Failed to load playlist!")
         return
 
-    song_ids = functools.reduce(
-        lambda l, i: l + [i["videoId"]], playlist_data["tracks"], []
-    )
+    song_ids = resolve_unavailable_tracks(ytm[1], playlist_data["tracks"])
 
     print("Creating playlist... ", end="", flush=True)
     try: